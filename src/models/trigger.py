@@ -1,12 +1,18 @@
 
-from typing import ClassVar, Mapping, Optional, Sequence, Tuple, cast
+from typing import ClassVar, Mapping, Sequence, Tuple, cast
 import asyncio
 import json
 import os
+import shutil
+import tempfile
+import threading
 import urllib.request
+import weakref
 import zipfile
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from vosk import Model as VoskModel, KaldiRecognizer
+import numpy as np
 import webrtcvad
 from typing_extensions import Self
 from viam.components.audio_in import AudioIn
@@ -18,11 +24,35 @@ from viam.resource.types import Model, ModelFamily
 from viam.utils import struct_to_dict
 from viam.streams import StreamWithIterator
 
+# WebRTC VAD requires specific frame sizes (10, 20, or 30ms)
+# At 16kHz: 30ms = 480 samples = 960 bytes
+VAD_SAMPLE_RATE = 16000
+VAD_FRAME_SAMPLES = 480
+VAD_FRAME_BYTES = VAD_FRAME_SAMPLES * 2
+
+# Most audio kept for one utterance while waiting for the trigger (~15 seconds);
+# older chunks are dropped from the front of the buffer. Also caps how much is
+# passed through after the trigger before the utterance is ended.
+MAX_BUFFER_BYTES = 500000
+
+# Loaded Vosk models by path; a model is read-only once loaded and can be
+# shared by every component (each audio stream keeps its own recognizer).
+# Weak values, so a model is freed once no component holds it.
+_MODEL_CACHE: "weakref.WeakValueDictionary[str, VoskModel]" = weakref.WeakValueDictionary()
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# Held while a model is downloaded and extracted, so components sharing a
+# missing model (or a reconfigure racing a running download) don't collide
+_DOWNLOAD_LOCK = threading.Lock()
+
 
 def download_vosk_model(model_name: str = "vosk-model-small-en-us-0.15", logger=None) -> str:
     """
     Download Vosk model if not present.
 
+    Downloads are serialized across components, and the model is extracted into a
+    temporary directory that is renamed into place, so a partial model is never visible.
+
     Args:
         model_name: Name of the Vosk model to download
         logger: Optional logger instance
@@ -32,43 +62,73 @@ def download_vosk_model(model_name: str = "vosk-model-small-en-us-0.15", logger=
     """
     model_dir = os.path.expanduser(f"~/{model_name}")
 
-    if os.path.exists(model_dir):
+    with _DOWNLOAD_LOCK:
+        if os.path.exists(model_dir):
+            if logger:
+                logger.info(f"Vosk model already exists at {model_dir}")
+            return model_dir
+
+        url = f"https://alphacephei.com/vosk/models/{model_name}.zip"
+
         if logger:
-            logger.info(f"Vosk model already exists at {model_dir}")
-        return model_dir
+            logger.info(f"Downloading Vosk model from {url}...")
+        else:
+            print(f"Downloading Vosk model from {url}...")
 
-    url = f"https://alphacephei.com/vosk/models/{model_name}.zip"
-    zip_path = f"/tmp/{model_name}.zip"
+        zip_fd, zip_path = tempfile.mkstemp(prefix=f"{model_name}-", suffix=".zip")
+        # Extract next to the final location so the rename stays on one filesystem
+        extract_dir = tempfile.mkdtemp(prefix=f".{model_name}-", dir=os.path.dirname(model_dir))
+        try:
+            # Stream to disk in 1 MB blocks so the archive is never held in memory
+            with os.fdopen(zip_fd, 'wb') as out_file, urllib.request.urlopen(url) as response:
+                shutil.copyfileobj(response, out_file, length=1 << 20)
 
-    if logger:
-        logger.info(f"Downloading Vosk model from {url}...")
-    else:
-        print(f"Downloading Vosk model from {url}...")
+            if logger:
+                logger.info(f"Extracting to {model_dir}...")
+            else:
+                print(f"Extracting to {model_dir}...")
 
-    try:
-        urllib.request.urlretrieve(url, zip_path)
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                zip_ref.extractall(extract_dir)
 
-        if logger:
-            logger.info(f"Extracting to {model_dir}...")
-        else:
-            print(f"Extracting to {model_dir}...")
+            # Model archives hold a single top-level directory named after the model
+            extracted = os.path.join(extract_dir, model_name)
+            os.rename(extracted if os.path.isdir(extracted) else extract_dir, model_dir)
 
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(os.path.expanduser("~"))
+            if logger:
+                logger.info(f"Vosk model downloaded successfully to {model_dir}")
+            else:
+                print(f"Vosk model downloaded successfully to {model_dir}")
 
-        os.remove(zip_path)
+            return model_dir
 
-        if logger:
-            logger.info(f"Vosk model downloaded successfully to {model_dir}")
-        else:
-            print(f"Vosk model downloaded successfully to {model_dir}")
+        except Exception as e:
+            if logger:
+                logger.error(f"Failed to download Vosk model: {e}")
+            raise RuntimeError(f"Failed to download Vosk model: {e}")
 
-        return model_dir
+        finally:
+            os.remove(zip_path)
+            shutil.rmtree(extract_dir, ignore_errors=True)
 
-    except Exception as e:
-        if logger:
-            logger.error(f"Failed to download Vosk model: {e}")
-        raise RuntimeError(f"Failed to download Vosk model: {e}")
+
+def load_vosk_model(model_path: str) -> VoskModel:
+    """
+    Load a Vosk model, reusing it if another component already loaded the same path.
+
+    Args:
+        model_path: Path to the model directory
+
+    Returns:
+        The loaded model
+    """
+    model_path = os.path.realpath(model_path)
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(model_path)
+        if model is None:
+            model = VoskModel(model_path)
+            _MODEL_CACHE[model_path] = model
+        return model
 
 
 class Trigger(AudioIn, EasyResource):
@@ -86,46 +146,87 @@ class Trigger(AudioIn, EasyResource):
         microphone = str(attrs.get("source_microphone", ""))
         instance.trigger_word = str(attrs.get("trigger_word", "")).lower()
         model_path = str(attrs.get("vosk_model_path", "~/vosk-model-small-en-us-0.15"))
+        # Without VAD every chunk is decoded and Vosk's own endpointing ends utterances (more CPU)
+        use_vad = attrs.get("use_vad", True)  # Checked to be a JSON boolean in validate_config
         vad_aggressiveness = int(attrs.get("vad_aggressiveness", 3))  # 0-3, higher = less sensitive
+        # RMS (in PCM16 units) below which a frame is treated as silence without running VAD, 0 = always run VAD.
+        # Off by default since the right value depends on the mic's noise floor and gain.
+        instance.energy_threshold = max(0.0, float(attrs.get("energy_threshold", 0)))
 
         instance.logger.info(f"Trigger word: '{instance.trigger_word}'")
-        instance.logger.info(f"VAD aggressiveness: {vad_aggressiveness}")
+        if not instance.trigger_word:
+            instance.logger.warning("No trigger_word configured, audio will never be forwarded")
 
         # Initialize WebRTC VAD (lightweight!)
-        instance.vad = webrtcvad.Vad(vad_aggressiveness)
-        instance.logger.info("WebRTC VAD initialized")
+        if use_vad:
+            instance.logger.info(f"VAD aggressiveness: {vad_aggressiveness}")
+            instance.logger.info(f"Energy threshold: {instance.energy_threshold}")
+            instance.vad = webrtcvad.Vad(vad_aggressiveness)
+            instance.logger.info("WebRTC VAD initialized")
+        else:
+            instance.vad = None
+            instance.logger.info("VAD disabled, using Vosk endpointing")
 
-        # Load Vosk model (download if needed)
+        # Get microphone
+        if microphone:
+            mic = dependencies[AudioIn.get_resource_name(microphone)]
+            instance.microphone_client = cast(AudioIn, mic)
+            instance.logger.info(f"Microphone: {microphone}")
+        else:
+            instance.microphone_client = None
+
+        # Create thread pool for Vosk processing (non-blocking)
+        instance.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vosk")
+        instance.logger.info("Thread pool executor created for Vosk processing")
+
+        # Set by close(); open streams end instead of scheduling more Vosk work
+        instance._closed = False
+
+        # Load Vosk model (download if needed) in the background so init doesn't block.
+        # It runs on the Vosk thread, so any Vosk work queues up behind it.
+        instance._model_future = instance.executor.submit(instance._load_model, model_path)
+
+        instance.logger.info("=== Init Complete ===")
+        return instance
+
+    def _load_model(self, model_path: str) -> VoskModel:
+        """
+        Load the Vosk model, downloading it first if it isn't on disk.
+
+        Args:
+            model_path: Path to the model directory
+
+        Returns:
+            The loaded model
+        """
         model_path = os.path.expanduser(model_path)
 
         # If path doesn't exist, try to download the default model
         if not os.path.exists(model_path):
-            instance.logger.info(f"Vosk model not found at {model_path}, attempting download...")
+            self.logger.info(f"Vosk model not found at {model_path}, attempting download...")
             # Extract model name from path
             model_name = os.path.basename(model_path)
             try:
-                model_path = download_vosk_model(model_name, instance.logger)
+                model_path = download_vosk_model(model_name, self.logger)
             except Exception as e:
-                instance.logger.error(f"Failed to download model: {e}")
+                # download_vosk_model has already logged the failure
                 raise RuntimeError(f"Vosk model not found at {model_path} and download failed: {e}")
 
-        instance.vosk_model = VoskModel(model_path)
-        instance.logger.info("Vosk model loaded")
+        model = load_vosk_model(model_path)
+        self.logger.info("Vosk model loaded")
+        return model
 
-        # Create thread pool for Vosk processing (non-blocking)
-        instance.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vosk")
-        instance.logger.info("Thread pool executor created for Vosk processing")
+    def _raise_if_model_failed(self):
+        """Raise the model load error, if loading has already failed."""
+        if self._model_future.done():
+            error = self._model_future.exception()
+            if error is not None:
+                raise error
 
-        # Get microphone
-        if microphone:
-            mic = dependencies[AudioIn.get_resource_name(microphone)]
-            instance.microphone_client = cast(AudioIn, mic)
-            instance.logger.info(f"Microphone: {microphone}")
-        else:
-            instance.microphone_client = None
-
-        instance.logger.info("=== Init Complete ===")
-        return instance
+    @property
+    def vosk_model(self) -> VoskModel:
+        """The Vosk model, waiting for the background load if it hasn't finished."""
+        return self._model_future.result()
 
     @classmethod
     def validate_config(cls, config: ComponentConfig) -> Tuple[Sequence[str], Sequence[str]]:
@@ -135,53 +236,217 @@ class Trigger(AudioIn, EasyResource):
         microphone = str(attrs.get("source_microphone", ""))
         if microphone:
             deps.append(microphone)
+        # bool("false") would be True, so require a real boolean
+        if not isinstance(attrs.get("use_vad", True), bool):
+            raise ValueError("use_vad must be a boolean (true or false)")
         return deps, []
 
-    def check_for_trigger(self, audio_bytes: bytes, sample_rate: int = 16000) -> bool:
+    def new_recognizer(self, sample_rate: int = VAD_SAMPLE_RATE) -> KaldiRecognizer:
         """
-        Check if trigger word is in audio.
+        Create a recognizer for one audio stream.
+
+        Decoder state carries over between chunks, so each stream needs its own
+        recognizer; it is reused across that stream's utterances.
 
         Args:
-            audio_bytes: Raw PCM16 audio data
             sample_rate: Audio sample rate
 
+        Returns:
+            A new recognizer on the shared model
+        """
+        return KaldiRecognizer(self.vosk_model, sample_rate)
+
+    def _result_has_trigger(self, result: dict) -> bool:
+        """
+        Check a Vosk result for the trigger word.
+
+        Args:
+            result: Parsed result from Result() or FinalResult()
+
         Returns:
             bool: True if trigger word detected
         """
-        try:
-            self.logger.debug(f"check_for_trigger: {len(audio_bytes)} bytes, {sample_rate} Hz")
+        self.logger.info(f"Vosk full result: {result}")
 
-            recognizer = KaldiRecognizer(self.vosk_model, sample_rate)
+        text = result.get("text", "").lower()
 
-            # Process audio
-            accepted = recognizer.AcceptWaveform(audio_bytes)
-            self.logger.debug(f"AcceptWaveform returned: {accepted}")
+        if text:
+            self.logger.info(f"Recognized text: '{text}'")
+        else:
+            self.logger.warning("Vosk returned EMPTY text - no speech recognized!")
 
-            # Get final result
-            result = json.loads(recognizer.FinalResult())
-            self.logger.info(f"Vosk full result: {result}")
+        if self.trigger_word and self.trigger_word in text:
+            self.logger.info(f"TRIGGER WORD '{self.trigger_word}' DETECTED!")
+            return True
 
-            text = result.get("text", "").lower()
+        return False
 
-            if text:
-                self.logger.info(f"Recognized text: '{text}'")
-            else:
-                self.logger.warning("Vosk returned EMPTY text - no speech recognized!")
+    def feed_audio(self, recognizer: KaldiRecognizer, audio_bytes: bytes) -> Tuple[bool, bool]:
+        """
+        Decode the next chunk of the current utterance.
+
+        Vosk decodes incrementally, so feeding chunks as they arrive spreads the
+        work over the utterance instead of decoding it all once speech ends.
 
-            if self.trigger_word and self.trigger_word in text:
-                self.logger.info(f"TRIGGER WORD '{self.trigger_word}' DETECTED!")
-                return True
+        Args:
+            recognizer: The stream's recognizer
+            audio_bytes: Raw PCM16 audio data
 
+        Returns:
+            Tuple of (trigger word heard in the utterance so far, Vosk ended the segment)
+        """
+        if not self.trigger_word:
+            return False, False
+
+        try:
+            # Vosk ends a segment on its own when it hears a long enough pause;
+            # that segment's text is only available from Result()
+            if recognizer.AcceptWaveform(audio_bytes):
+                result = json.loads(recognizer.Result())
+
+                # Without VAD, Vosk also closes segments after long silence; those have no text
+                if not result.get("text"):
+                    self.logger.debug("Vosk closed a segment with no speech")
+                    return False, True
+
+                return self._result_has_trigger(result), True
+
+            # Otherwise check the running hypothesis so we can fire before speech ends.
+            # This runs on every chunk, so only parse the JSON when the raw string could match.
+            raw_partial = recognizer.PartialResult().lower()
+            if self.trigger_word not in raw_partial:
+                return False, False
+
+            partial = json.loads(raw_partial).get("partial", "")
+            if self.trigger_word in partial:
+                self.logger.info(f"TRIGGER WORD '{self.trigger_word}' DETECTED in partial result '{partial}'")
+                return True, False
+
+            return False, False
+        except Exception as e:
+            self.logger.error(f"Vosk error: {e}", exc_info=True)
+            return False, False
+
+    def check_for_trigger(self, recognizer: KaldiRecognizer) -> bool:
+        """
+        Finish the current utterance and check if trigger word is in it.
+
+        The recognizer is ready for the next utterance afterwards.
+
+        Args:
+            recognizer: The stream's recognizer
+
+        Returns:
+            bool: True if trigger word detected
+        """
+        if not self.trigger_word:
             return False
+
+        try:
+            detected = self._result_has_trigger(json.loads(recognizer.FinalResult()))
+            recognizer.Reset()
+            return detected
         except Exception as e:
             self.logger.error(f"Vosk error: {e}", exc_info=True)
             return False
 
+    def _vad_frames(self, audio_data: bytes) -> np.ndarray:
+        """
+        Run VAD over every complete frame of a PCM16 chunk in one pass.
+
+        If energy_threshold is set, frames whose RMS energy is below it are marked
+        as silence up front, so VAD only runs on frames that could contain speech.
+
+        Args:
+            audio_data: Raw PCM16 audio data at 16kHz
+
+        Returns:
+            Boolean array with one speech decision per frame (trailing partial frame is dropped)
+        """
+        # Slice a memoryview so each frame shares the chunk's buffer instead of copying it
+        audio_view = memoryview(audio_data)
+        n_frames = len(audio_view) // VAD_FRAME_BYTES
+        vad_is_speech = self.vad.is_speech
+
+        if self.energy_threshold > 0:
+            # Mean square energy of each frame, computed for the whole chunk at once
+            samples = np.frombuffer(audio_data, dtype=np.int16, count=n_frames * VAD_FRAME_SAMPLES)
+            energy = np.square(samples.reshape(n_frames, VAD_FRAME_SAMPLES), dtype=np.float32).mean(axis=1)
+            candidates = np.flatnonzero(energy >= self.energy_threshold ** 2)
+        else:
+            candidates = range(n_frames)
+
+        speech = np.zeros(n_frames, dtype=bool)
+        for n in candidates:
+            # Frames are always exactly VAD_FRAME_BYTES, the only input VAD rejects is a bad size
+            offset = n * VAD_FRAME_BYTES
+            speech[n] = vad_is_speech(audio_view[offset:offset + VAD_FRAME_BYTES], VAD_SAMPLE_RATE)
+        return speech
+
+    @staticmethod
+    def _track_silence(
+        speech: np.ndarray, is_speech_active: bool, silence_frames: int, max_silence_frames: int
+    ) -> Tuple[bool, int, bool]:
+        """
+        Advance the speech/silence state over one chunk of VAD decisions.
+
+        Speech ends at the first frame that completes a run of max_silence_frames
+        silent frames after speech has started; frames after it are ignored.
+
+        Args:
+            speech: Per-frame speech decisions for the chunk
+            is_speech_active: Whether speech was active before the chunk
+            silence_frames: Silent frames counted since the last speech frame
+            max_silence_frames: Silent frames that end speech
+
+        Returns:
+            Tuple of (is_speech_active, silence_frames, speech_ended)
+        """
+        if not len(speech):
+            return is_speech_active, silence_frames, False
+
+        # Fast path for the common case of a quiet room: nothing to count
+        if not is_speech_active and not speech.any():
+            return False, 0, False
+
+        frames = np.arange(len(speech))
+        # Most recent speech frame at or before each frame (-1 if none yet in this chunk)
+        last_speech = np.maximum.accumulate(np.where(speech, frames, -1))
+        # Length of the silence run ending at each frame, continuing the run carried in from earlier chunks
+        silence_run = np.where(last_speech >= 0, frames - last_speech, frames + 1 + silence_frames)
+        # Silence only counts once speech has started
+        counting = (last_speech >= 0) | is_speech_active
+
+        ended = counting & (silence_run >= max_silence_frames)
+        if ended.any():
+            return True, int(silence_run[ended.argmax()]), True
+
+        if counting[-1]:
+            return True, int(silence_run[-1]), False
+        return False, 0, False
+
+    def discard_utterance(self, recognizer: KaldiRecognizer):
+        """Drop the recognizer state for the current utterance without decoding the rest of it."""
+        recognizer.Reset()
+
+    async def _run_vosk(self, func, *args):
+        """
+        Run a Vosk call on the Vosk executor so decoding doesn't block the event loop.
+
+        The executor has a single worker, so model loading and decoding never run concurrently.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
     async def get_audio(self, codec: str, duration_seconds: float, previous_timestamp_ns: int, **kwargs):
         """
-        Stream audio, yielding buffered chunks when trigger word detected.
+        Stream audio, yielding only utterances that contain the trigger word.
 
-        Uses WebRTC VAD to detect speech (low CPU), then Vosk to find trigger.
+        By default WebRTC VAD finds speech (low CPU) and only speech is decoded by
+        Vosk; with use_vad false every chunk is decoded and Vosk's endpointing
+        decides where utterances end. Chunks are buffered until the trigger is
+        heard, then the buffer is yielded and the rest of the utterance is passed
+        through live as it arrives.
 
         Args:
             codec: Audio codec (should be "pcm16")
@@ -195,8 +460,10 @@ class Trigger(AudioIn, EasyResource):
             self.logger.error("No microphone configured")
             return
 
+        self._raise_if_model_failed()
+
         async def audio_generator():
-            self.logger.info("Starting trigger detection with VAD...")
+            self.logger.info(f"Starting trigger detection with {'VAD' if self.vad else 'Vosk endpointing'}...")
 
             # Check mic properties
             #mic_props = await self.microphone_client.get_properties()
@@ -205,122 +472,136 @@ class Trigger(AudioIn, EasyResource):
             # Get continuous stream from microphone
             mic_stream = await self.microphone_client.get_audio(codec, 0, 0)
 
-            # Buffers
-            chunk_buffer = []  # AudioResponse objects (with timestamps!)
-            byte_buffer = bytearray()
+            try:
+                # The model may still be loading from init; a failed load is raised to the client
+                if self.trigger_word:
+                    await asyncio.wrap_future(self._model_future)
 
-            # Speech detection state
-            is_speech_active = False
-            silence_frames = 0
-            max_silence_frames = 30  # ~1 second of silence to end speech
+                    # One recognizer per stream, reused (and reset) across its utterances
+                    recognizer = await self._run_vosk(self.new_recognizer)
 
-            async for response in mic_stream:
-                audio_data = response.audio.audio_data
+                # Buffers
+                chunk_buffer = deque()  # AudioResponse objects (with timestamps!)
+                buffered_bytes = 0
+                passed_bytes = 0  # Forwarded live since the trigger
 
-                if not audio_data:
-                    continue
+                # Speech detection state
+                is_speech_active = False
+                trigger_detected = False
+                silence_frames = 0
+                max_silence_frames = 30  # ~1 second of silence to end speech
 
-                # Check PCM16 alignment (2 bytes per sample)
-                if len(audio_data) % 2 != 0:
-                    self.logger.warning(f"Misaligned audio chunk detected: {len(audio_data)} bytes (odd length)")
+                # Without a trigger word nothing can match, so don't spend time decoding
+                use_vosk = bool(self.trigger_word)
+                use_vad = self.vad is not None
 
-                # WebRTC VAD requires specific frame sizes (10, 20, or 30ms)
-                # At 16kHz: 30ms = 480 samples = 960 bytes
-                frame_size = 960
+                async for response in mic_stream:
+                    if self._closed:
+                        break
 
-                # Track if we should process this batch
-                should_process = False
+                    audio_data = response.audio.audio_data
 
-                # Process audio in VAD-compatible frames
-                for i in range(0, len(audio_data), frame_size):
-                    frame = audio_data[i:i + frame_size]
+                    if not audio_data:
+                        continue
 
-                    if len(frame) < frame_size:
-                        continue  # Skip incomplete frames
+                    # Check PCM16 alignment (2 bytes per sample)
+                    if len(audio_data) % 2 != 0:
+                        self.logger.warning(f"Misaligned audio chunk detected: {len(audio_data)} bytes (odd length)")
 
-                    # Check if frame contains speech (vad is cheap CPU)
-                    try:
-                        is_speech = self.vad.is_speech(frame, 16000)
-                    except:
-                        is_speech = False
+                    if use_vad:
+                        # Check each frame for speech (vad is cheap CPU)
+                        was_speech_active = is_speech_active
+                        is_speech_active, silence_frames, should_process = self._track_silence(
+                            self._vad_frames(audio_data), is_speech_active, silence_frames, max_silence_frames
+                        )
 
-                    if is_speech:
-                        if not is_speech_active:
+                        if is_speech_active and not was_speech_active:
                             self.logger.debug("Speech started")
-                            is_speech_active = True
-                        silence_frames = 0
+                        if should_process:
+                            self.logger.debug(f"Speech ended ({silence_frames} silent frames)")
                     else:
-                        if is_speech_active:
-                            silence_frames += 1
+                        # Every chunk goes to Vosk, whose endpointing decides where speech ends
+                        is_speech_active = True
+                        should_process = False
+
+                    # Only buffer (and decode) during active speech (not during silence)
+                    if is_speech_active:
+                        if trigger_detected:
+                            # Trigger already heard, pass the rest of the utterance straight through
+                            yield response
+                            passed_bytes += len(audio_data)
+
+                            # Nothing else ends the utterance if noise keeps VAD active, so cap it
+                            if passed_bytes > MAX_BUFFER_BYTES:
+                                self.logger.warning("Utterance too long after trigger, ending it")
+                                should_process = True
+                        else:
+                            chunk_buffer.append(response)
+                            buffered_bytes += len(audio_data)
+
+                            # Rolling window: the audio is already decoded, so old chunks are only needed for replay
+                            while buffered_bytes > MAX_BUFFER_BYTES:
+                                buffered_bytes -= len(chunk_buffer.popleft().audio.audio_data)
 
-                            if silence_frames >= max_silence_frames:
-                                self.logger.debug(f"Speech ended ({silence_frames} silent frames)")
+                        # With VAD there's no need to keep decoding once triggered, without it
+                        # decoding is what finds the end of the utterance
+                        if use_vosk and not (use_vad and trigger_detected):
+                            heard, segment_ended = await self._run_vosk(self.feed_audio, recognizer, audio_data)
+
+                            if heard and not trigger_detected:
+                                # Trigger heard mid-utterance, don't wait for speech to end
+                                trigger_detected = True
+                                self.logger.info(f"TRIGGER! Yielding {len(chunk_buffer)} chunks ({buffered_bytes} bytes)")
+
+                                for chunk in chunk_buffer:
+                                    yield chunk
+
+                                chunk_buffer.clear()
+                                buffered_bytes = 0
+
+                            if segment_ended and not use_vad:
+                                self.logger.debug("Speech ended (Vosk endpoint)")
                                 should_process = True
-                                break  # Exit frame loop
-
-                # Only buffer during active speech (not during silence)
-                if is_speech_active:
-                    chunk_buffer.append(response)
-                    byte_buffer.extend(audio_data)
-
-                # If speech ended, check for trigger
-                if should_process:
-                    self.logger.debug(f"Checking {len(byte_buffer)} bytes for trigger")
-
-                    # Run Vosk in thread pool to avoid blocking event loop
-                    loop = asyncio.get_event_loop()
-                    audio_to_check = bytes(byte_buffer)
-                    trigger_detected = await loop.run_in_executor(
-                        self.executor,
-                        self.check_for_trigger,
-                        audio_to_check
-                    )
-
-                    if trigger_detected:
-                        # Trigger detected! Yield all buffered chunks
-                        self.logger.info(f"TRIGGER! Yielding {len(chunk_buffer)} chunks ({len(byte_buffer)} bytes)")
-
-                        for chunk in chunk_buffer:
-                            yield chunk
-
-                        self.logger.info("Ready for next trigger")
-                    else:
-                        self.logger.debug("No trigger found")
-
-                    # Clear buffers either way
-                    chunk_buffer.clear()
-                    byte_buffer.clear()
-                    is_speech_active = False
-                    silence_frames = 0
-
-                # Prevent buffers from growing too large (safety)
-                if len(byte_buffer) > 500000:  # ~15 seconds max
-                    self.logger.warning("Buffer too large, force checking")
-
-                    # Run Vosk in thread pool (non-blocking)
-                    loop = asyncio.get_event_loop()
-                    audio_to_check = bytes(byte_buffer)
-                    trigger_detected = await loop.run_in_executor(
-                        self.executor,
-                        self.check_for_trigger,
-                        audio_to_check
-                    )
-
-                    if trigger_detected:
-                        self.logger.info(f"TRIGGER! Yielding {len(chunk_buffer)} chunks")
-                        for chunk in chunk_buffer:
-                            yield chunk
-
-                    chunk_buffer.clear()
-                    byte_buffer.clear()
-                    is_speech_active = False
-                    silence_frames = 0
+
+                    # If speech ended, check for trigger
+                    if should_process:
+                        if trigger_detected:
+                            # Utterance was already passed through, nothing left to decode
+                            await self._run_vosk(self.discard_utterance, recognizer)
+                            self.logger.info("Ready for next trigger")
+                        elif use_vad and use_vosk and await self._run_vosk(self.check_for_trigger, recognizer):
+                            # Trigger in the final result! Yield all buffered chunks
+                            self.logger.info(f"TRIGGER! Yielding {len(chunk_buffer)} chunks ({buffered_bytes} bytes)")
+
+                            for chunk in chunk_buffer:
+                                yield chunk
+
+                            self.logger.info("Ready for next trigger")
+                        else:
+                            self.logger.debug("No trigger found")
+
+                        # Clear buffers either way
+                        chunk_buffer.clear()
+                        buffered_bytes = 0
+                        passed_bytes = 0
+                        is_speech_active = False
+                        trigger_detected = False
+                        silence_frames = 0
+            except RuntimeError:
+                # close() shut the Vosk executor down while this stream was running
+                if not self._closed:
+                    raise
+                self.logger.debug("Trigger component closed, ending stream")
 
         return StreamWithIterator(audio_generator())
 
     async def close(self):
         """Clean up resources."""
         self.logger.info("Closing trigger component")
+        self._closed = True
+        # Queued Vosk calls are left to finish (they're short) rather than cancelled, so streams
+        # waiting on them see the closed flag and end cleanly instead of getting a CancelledError
+        self.executor.shutdown(wait=False)
 
     async def do_command(self, command, **kwargs):
         raise NotImplementedError()
@@ -330,6 +611,7 @@ class Trigger(AudioIn, EasyResource):
 
     async def get_properties(self, **kwargs):
         self.logger.debug("get_properties called")
+        self._raise_if_model_failed()
         # Return properties from underlying microphone
         if self.microphone_client:
             return await self.microphone_client.get_properties()